@@ -1,15 +1,16 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import Optional
-import json
+import orjson
 import typer
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 from rich.markdown import Markdown
 
 from .db import init_db
 from .services import (
-    create_note, list_notes, get_note, edit_note,
+    create_note, create_notes, list_notes, list_notes_iter, get_note, edit_note,
     delete_note, pin_note, archive_note, restore_note, purge_note,
     extract_links, backlinks_for,  # already in your services
     # search_notes_fts is optional; uncomment if you added FTS
@@ -39,7 +40,6 @@ def _list(
     archived: bool = typer.Option(False, "--archived"),
     sort: str = typer.Option("updated", "--sort", help="updated|created|title"),
 ):
-    notes = list_notes(tag=tag, search=search, include_archived=archived, sort=sort)
     table = Table(title="Notely")
     table.add_column("ID", justify="right", style="cyan")
     table.add_column("Title", style="bold")
@@ -47,13 +47,18 @@ def _list(
     table.add_column("Pinned")
     table.add_column("Archived")
     table.add_column("Updated")
-    for n in notes:
-        table.add_row(
-            str(n.id), n.title, ", ".join(n.tags),
-            "✓" if n.pinned else "", "✓" if n.archived else "",
-            n.updated_at.isoformat(timespec="minutes"),
-        )
-    console.print(table)
+    # stream rows as they come off the cursor so the first screenful renders
+    # before the last note is fetched
+    # summary rows: the table never shows content, so don't fetch it
+    with Live(table, console=console, refresh_per_second=8):
+        for n in list_notes_iter(
+            tag=tag, search=search, include_archived=archived, sort=sort, summary=True
+        ):
+            table.add_row(
+                str(n.id), n.title, ", ".join(n.tags),
+                "✓" if n.pinned else "", "✓" if n.archived else "",
+                n.updated_at.isoformat(timespec="minutes"),
+            )
 
 @app.command()
 def show(identifier: str):
@@ -131,28 +136,36 @@ def purge(identifier: str):
 @app.command()
 def export(to: Path = typer.Option(..., "--to")):
     notes = list_notes(include_archived=True)
-    payload = [
-        {
-            "id": n.id,
-            "title": n.title,
-            "content": n.content,
-            "tags": n.tags,
-            "pinned": n.pinned,
-            "archived": n.archived,
-            "created_at": n.created_at.isoformat(),
-            "updated_at": n.updated_at.isoformat(),
-        }
-        for n in notes
-    ]
-    to.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    console.print(f"[green]Exported[/] {len(payload)} notes → {to}")
+    # write one note at a time instead of materializing the whole JSON
+    # document in memory alongside the note list; orjson serializes the
+    # datetimes natively (RFC 3339, same shape isoformat produced)
+    count = 0
+    with to.open("wb") as fh:
+        fh.write(b"[")
+        for n in notes:
+            fh.write(b",\n" if count else b"\n")
+            fh.write(orjson.dumps(
+                {
+                    "id": n.id,
+                    "title": n.title,
+                    "content": n.content,
+                    "tags": n.tags,
+                    "pinned": n.pinned,
+                    "archived": n.archived,
+                    "created_at": n.created_at,
+                    "updated_at": n.updated_at,
+                },
+                option=orjson.OPT_INDENT_2,
+            ))
+            count += 1
+        fh.write(b"\n]")
+    console.print(f"[green]Exported[/] {count} notes → {to}")
 
 @app.command()
 def import_(from_: Path = typer.Option(..., "--from")):
-    data = json.loads(from_.read_text(encoding="utf-8"))
-    for item in data:
-        create_note(item["title"], item.get("content", ""), item.get("tags", []))
-    console.print(f"[green]Imported[/] {len(data)} notes")
+    data = orjson.loads(from_.read_bytes())
+    count = len(create_notes(data))
+    console.print(f"[green]Imported[/] {count} notes")
 
 def main():
     app()
@@ -1,10 +1,16 @@
 from pathlib import Path
 import os
+import threading
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel, Session, create_engine
 from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
 
 _ENGINE = None
 _ENGINE_URL = None  # track current engine's URL so we can switch when env changes
+_SESSION_FACTORY = None  # sessionmaker bound to the current engine
 
 def _compute_url() -> str:
     env_path = os.getenv("NOTELY_DB_PATH")  # <-- exact spelling: NOTELY
@@ -17,43 +23,194 @@ def _compute_url() -> str:
         db_path.parent.mkdir(parents=True, exist_ok=True)
         return f"sqlite:///{db_path}"
 
+# Applied on every new connection: WAL lets readers run concurrently with a
+# writer, NORMAL sync halves fsyncs (safe with WAL), the rest trade a bit of
+# memory for fewer disk reads.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
+def _on_connect(dbapi_conn, _record):
+    cursor = dbapi_conn.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 def get_engine():
-    global _ENGINE, _ENGINE_URL
+    global _ENGINE, _ENGINE_URL, _SESSION_FACTORY
     url = _compute_url()
     if _ENGINE is None or _ENGINE_URL != url:
         # swap engine if URL changed (common in tests)
         if _ENGINE is not None:
             _ENGINE.dispose()
-        _ENGINE = create_engine(url, echo=False, future=True)
+        _ENGINE = create_engine(
+            url, echo=False, future=True, connect_args={"check_same_thread": False}
+        )
+        event.listens_for(_ENGINE, "connect")(_on_connect)
         _ENGINE_URL = url
+        # build the session factory once per engine; per-call construction
+        # re-parses all Session options on every request
+        _SESSION_FACTORY = sessionmaker(
+            bind=_ENGINE, class_=Session, autoflush=False, expire_on_commit=False
+        )
     return _ENGINE
 
 def reset_engine():
     """For tests: drop the cached engine so a new NOTELY_DB_PATH is picked up."""
-    global _ENGINE, _ENGINE_URL
+    global _ENGINE, _ENGINE_URL, _SESSION_FACTORY
     if _ENGINE is not None:
         _ENGINE.dispose()
     _ENGINE = None
     _ENGINE_URL = None
+    _SESSION_FACTORY = None
+
+# Indexes matching list_notes' WHERE archived=0 ORDER BY ... shape, so the
+# common listings are index range scans with no sort step. The timestamp
+# indexes are partial: they only cover active notes (the default filter),
+# keeping them small and letting the scan skip archived rows entirely.
+_LIST_INDEXES = (
+    "DROP INDEX IF EXISTS ix_note_archived_updated",
+    "DROP INDEX IF EXISTS ix_note_archived_created",
+    "CREATE INDEX IF NOT EXISTS ix_note_active_updated"
+    " ON note(updated_at DESC) WHERE archived = 0",
+    "CREATE INDEX IF NOT EXISTS ix_note_active_created"
+    " ON note(created_at DESC) WHERE archived = 0",
+    "CREATE INDEX IF NOT EXISTS ix_note_archived_title ON note(archived, title)",
+)
+
+# Full-text index over title/content, kept in sync by triggers so every write
+# path (ORM, bulk insert, raw SQL) is covered. External-content table: the
+# note row stays the single source of truth. The trigram tokenizer serves
+# arbitrary substrings (>= 3 chars), including [[Title]] backlink markers.
+_FTS_TOKENIZE = "tokenize='trigram'"
+_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS note_fts USING fts5("
+    f"title, content, content='note', content_rowid='id', {_FTS_TOKENIZE})",
+    "CREATE TRIGGER IF NOT EXISTS note_fts_ai AFTER INSERT ON note BEGIN "
+    "INSERT INTO note_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS note_fts_ad AFTER DELETE ON note BEGIN "
+    "INSERT INTO note_fts(note_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS note_fts_au AFTER UPDATE ON note BEGIN "
+    "INSERT INTO note_fts(note_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); "
+    "INSERT INTO note_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+)
+
+def _table_exists(conn, name: str) -> bool:
+    return conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (name,)
+    ).first() is not None
 
 def init_db():
     engine = get_engine()
+    with engine.connect() as conn:
+        had_notetag = _table_exists(conn, "notetag")
     SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        if not had_notetag:
+            # backfill tag rows for databases that predate the notetag table
+            for nid, csv in conn.exec_driver_sql(
+                "SELECT id, tags_csv FROM note WHERE tags_csv != ''"
+            ):
+                for tag in set(filter(None, csv.split(","))):
+                    conn.exec_driver_sql(
+                        "INSERT OR IGNORE INTO notetag (note_id, tag) VALUES (?, ?)",
+                        (nid, tag),
+                    )
+        for ddl in _LIST_INDEXES:
+            conn.exec_driver_sql(ddl)
+        note_sql = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='note'"
+        ).first()
+        if note_sql and "NOCASE" not in note_sql[0].upper():
+            # database predates the NOCASE collation on title (create_all
+            # never alters existing tables); its ix_note_title uses binary
+            # collation, so give case-insensitive lookups their own index
+            conn.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS ix_note_title_nocase"
+                " ON note(title COLLATE NOCASE)"
+            )
+        fts_sql = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='note_fts'"
+        ).first()
+        had_fts = fts_sql is not None
+        if had_fts and _FTS_TOKENIZE not in fts_sql[0]:
+            # tokenizer changed; drop and rebuild with the current config
+            conn.exec_driver_sql("DROP TABLE note_fts")
+            had_fts = False
+        for ddl in _FTS_DDL:
+            conn.exec_driver_sql(ddl)
+        if not had_fts:
+            # index any notes that existed before the FTS table was introduced
+            conn.exec_driver_sql("INSERT INTO note_fts(note_fts) VALUES ('rebuild')")
+        conn.exec_driver_sql("ANALYZE")
 
 def get_session():
     # keep objects alive after commit so returned models retain values
-    return Session(get_engine(), expire_on_commit=False)
+    get_engine()  # ensure the factory is bound to the current URL
+    return _SESSION_FACTORY()
+
+
+# Session for the current task/thread; lets nested session_scope() calls share
+# one session and transaction instead of paying checkout/BEGIN/teardown each.
+_CURRENT_SESSION: ContextVar[Optional[Session]] = ContextVar(
+    "notely_session", default=None
+)
+
+# Monotonic write counter for this process; read-side caches key on it so any
+# committed write invalidates them. Writes from *other* processes (CLI beside
+# the server, multiple uvicorn workers) don't bump it — cross-process readers
+# rely on those caches' TTLs instead.
+_DATA_VERSION = 0
+_PENDING_BUMP: ContextVar[bool] = ContextVar("notely_dirty", default=False)
+
+# Guards _DATA_VERSION and the caches keyed on it (services._TITLE_IDS):
+# API handlers run the service layer in a threadpool, so concurrent commits
+# must not lose a bump and cache writers must not corrupt the TTLCache's
+# internal bookkeeping (cachetools is not thread-safe).
+_STATE_LOCK = threading.Lock()
+
+
+def data_version() -> int:
+    return _DATA_VERSION
+
+
+def mark_data_changed() -> None:
+    """Record that the current session_scope wrote data. The outermost scope
+    bumps the version only after its commit succeeds, so concurrent readers
+    never cache pre-commit state under a post-commit version key."""
+    _PENDING_BUMP.set(True)
 
 
 @contextmanager
 def session_scope():
+    existing = _CURRENT_SESSION.get()
+    if existing is not None:
+        # nested scope: reuse the caller's session; the outermost scope owns
+        # the commit/rollback/close
+        yield existing
+        return
     session = get_session()
+    token = _CURRENT_SESSION.set(session)
+    bump_token = _PENDING_BUMP.set(False)
     try:
         yield session
         session.commit()
+        if _PENDING_BUMP.get():
+            global _DATA_VERSION
+            with _STATE_LOCK:
+                _DATA_VERSION += 1
     except:
         session.rollback()
         raise
     finally:
+        _PENDING_BUMP.reset(bump_token)
+        _CURRENT_SESSION.reset(token)
         session.close()
 
@@ -1,11 +1,32 @@
 from __future__ import annotations
-from datetime import datetime, UTC
+from datetime import datetime
 from typing import Optional
+from sqlalchemy import Column, DateTime, String, func
 from sqlmodel import Field, SQLModel
 
+
+def normalize_tags(tags: list[str] | None) -> list[str]:
+    """Strip/lowercase/dedupe tags in one pass, returned sorted."""
+    if not tags:
+        return []
+    seen: set[str] = set()
+    out: list[str] = []
+    for t in tags:
+        if not t:
+            continue
+        t = t.strip().lower()
+        if t and t not in seen:
+            seen.add(t)
+            out.append(t)
+    out.sort()
+    return out
+
+
 class Note(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    title: str
+    # NOCASE collation so the index also serves case-insensitive prefix LIKE
+    # (SQLite only rewrites LIKE 'foo%' into an index range scan then)
+    title: str = Field(sa_column=Column(String(collation="NOCASE"), nullable=False, index=True))
     content: str = ""
     # store tags as CSV for MVP
     tags_csv: str = Field(default="", index=True)
@@ -14,21 +35,47 @@ class Note(SQLModel, table=True):
     pinned: bool = Field(default=False, index=True)
     archived: bool = Field(default=False, index=True)
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    # timestamps are stamped in SQL (CURRENT_TIMESTAMP, UTC): INSERTs and
+    # UPDATEs don't bind a Python-allocated datetime parameter at all. The
+    # client-side default renders the expression inside the INSERT itself,
+    # which also covers databases created before the columns had a
+    # server_default (create_all never alters an existing table)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime, nullable=False, default=func.now(), server_default=func.now()
+        ),
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime,
+            nullable=False,
+            default=func.now(),
+            server_default=func.now(),
+            onupdate=func.now(),
+        ),
+    )
 
     @property
     def tags(self) -> list[str]:
-        if not self.tags_csv:
+        csv = self.tags_csv
+        if not csv:
             return []
-        return [t for t in self.tags_csv.split(",") if t]
+        # parse once per tags_csv value; loops that render tags repeatedly
+        # (CLI table, export) hit the cache instead of re-splitting the CSV
+        cache = getattr(self, "_tags_cache", None)
+        if cache is None or cache[0] != csv:
+            cache = (csv, [t for t in csv.split(",") if t])
+            object.__setattr__(self, "_tags_cache", cache)
+        return cache[1]
 
     def set_tags(self, tags: list[str] | None) -> None:
-        if not tags:
-            self.tags_csv = ""
-            return
-        norm = sorted({t.strip().lower() for t in tags if t and t.strip()})
-        self.tags_csv = ",".join(norm)
-
-    def touch(self) -> None:
-        self.updated_at = datetime.now(UTC)
+        self.tags_csv = ",".join(normalize_tags(tags))
+
+class NoteTag(SQLModel, table=True):
+    """Normalized (note_id, tag) rows so tag filters are indexed equality
+    lookups; tags_csv on Note stays as the denormalized display cache."""
+
+    note_id: int = Field(foreign_key="note.id", primary_key=True)
+    tag: str = Field(primary_key=True, index=True)
@@ -1,75 +1,307 @@
 from __future__ import annotations
-from datetime import UTC,datetime
-from typing import Iterable, Optional
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, NamedTuple, Optional
+from sqlalchemy import bindparam, delete as sa_delete, false, func, insert, text, update
 from sqlmodel import select
 import re
 
-from .db import session_scope
-from .models import Note
+from cachetools import TTLCache
 
+from .db import _STATE_LOCK, data_version, mark_data_changed, session_scope
+from .models import Note, NoteTag, normalize_tags
 
-BACKLINK_RE = re.compile(r"\[\[([^\]]+)\]\]")
 
-def _normal_tags(tags: Optional[Iterable[str]]) -> list[str]:
-    if not tags:
-        return []
-    return sorted({t.strip().lower() for t in tags if t and t.strip()})
+# re.ASCII keeps the pattern on the simpler byte-class state machine; the
+# pattern itself has no unicode-dependent classes
+BACKLINK_RE = re.compile(r"\[\[([^\]]+)\]\]", re.ASCII)
+
+# subquery reused by the search branch of list_notes; MATCH runs against the
+# note_fts inverted index created in init_db
+_FTS_ROWIDS = text("SELECT rowid FROM note_fts WHERE note_fts MATCH :fts_q")
+
+def _fts_query(search: str) -> str:
+    # quote the user's text as a single string (so FTS5 operators like AND/OR
+    # or stray quotes can't break the query); with the trigram tokenizer a
+    # quoted query is a plain substring match
+    return '"' + search.replace('"', '""') + '"'
+
+def _title_eq(title: str):
+    """Case-insensitive title equality, explicit so it also applies on
+    databases created before the title column carried the NOCASE collation
+    (and matches the COLLATE NOCASE index either way)."""
+    return Note.title.collate("NOCASE") == title
+
+
+def _sync_note_tags(s, note_id: int, tags: list[str]) -> None:
+    """Replace the NoteTag rows for a note with the given normalized tags."""
+    s.execute(sa_delete(NoteTag).where(NoteTag.note_id == note_id))
+    if tags:
+        s.add_all([NoteTag(note_id=note_id, tag=t) for t in tags])
 
 
 def create_note(title: str, content: str = "", tags: Optional[Iterable[str]] = None) -> Note:
 
-    tags_list = _normal_tags(tags)
+    tags_list = normalize_tags(tags)
     with session_scope() as s:
-        note = Note(title=title, content=content)
-        note.set_tags(tags_list)
-        s.add(note)
-        s.flush()  # get the ID assigned
-        s.refresh(note)  # get any defaults set by DB
+        # INSERT ... RETURNING hands back the complete row — id and the
+        # server-side timestamps — in one round trip, replacing the old
+        # flush-then-refresh SELECT
+        note = s.scalars(
+            insert(Note)
+            .values(title=title, content=content, tags_csv=",".join(tags_list))
+            .returning(Note)
+        ).one()
+        _sync_note_tags(s, note.id, tags_list)
+        mark_data_changed()
         return note
     
+def create_notes(items: Iterable[dict]) -> list[int]:
+    """Create many notes in one transaction (one commit/fsync total).
+
+    Each item is a dict with "title" and optional "content"/"tags", the
+    shape produced by the CLI export. Returns the assigned ids in input
+    order. Uses executemany INSERT ... RETURNING, so no ORM objects are
+    built and no per-row flush/refresh happens.
+    """
+    ids: list[int] = []
+    with session_scope() as s:
+        def _insert(rows: list[dict], tag_sets: list[list[str]]) -> None:
+            result = s.execute(
+                insert(Note).returning(Note.id, sort_by_parameter_order=True), rows
+            )
+            batch_ids = [r[0] for r in result]
+            ids.extend(batch_ids)
+            tag_rows = [
+                {"note_id": nid, "tag": t}
+                for nid, tags in zip(batch_ids, tag_sets)
+                for t in tags
+            ]
+            if tag_rows:
+                s.execute(insert(NoteTag), tag_rows)
+
+        rows: list[dict] = []
+        tag_sets: list[list[str]] = []
+        for item in items:
+            tags = normalize_tags(item.get("tags"))
+            rows.append({
+                "title": item["title"],
+                "content": item.get("content", ""),
+                "tags_csv": ",".join(tags),
+            })
+            tag_sets.append(tags)
+            if len(rows) >= 500:
+                _insert(rows, tag_sets)
+                rows, tag_sets = [], []
+        if rows:
+            _insert(rows, tag_sets)
+        mark_data_changed()
+    return ids
+
+
+class NoteSummary(NamedTuple):
+    """List-view row carrying everything but the content blob."""
+
+    id: int
+    title: str
+    tags_csv: str
+    pinned: bool
+    archived: bool
+    updated_at: datetime
+
+    @property
+    def tags(self) -> list[str]:
+        return [t for t in self.tags_csv.split(",") if t] if self.tags_csv else []
+
+
+_SUMMARY_COLS = (
+    Note.id, Note.title, Note.tags_csv, Note.pinned, Note.archived, Note.updated_at
+)
+
+# ORDER BY expressions built once at import; unknown sort names fall back to
+# "updated" like the old branch chain did
+_SORT_ORDERS = {
+    "created": Note.created_at.desc(),
+    "title": Note.title.asc(),
+    "updated": Note.updated_at.desc(),
+}
+
+
 def list_notes(
     tag: Optional[str] = None,
     search: Optional[str] = None,
     include_archived: bool = False,
     sort: str = "updated",  # "updated" | "created" | "title"
-) -> list[Note]:
+    title_prefix: Optional[str] = None,
+    summary: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> list[Note] | list[NoteSummary]:
     """
     Return notes with optional filtering and sorting.
-    - tag: match within normalized tags (simple LIKE for MVP)
+    - tag: match an exact normalized tag
     - search: substring in title or content
     - include_archived: include archived notes
     - sort: updated|created|title
+    - title_prefix: case-insensitive title prefix (autocomplete-style)
+    - summary: return NoteSummary rows without content (cheaper for list views)
+    - limit/offset: page through results instead of hydrating everything
     """
+    stmt, params = _build_list_stmt(
+        tag, search, include_archived, sort, title_prefix, summary
+    )
+    if limit is not None or offset:
+        stmt = stmt.limit(limit).offset(offset)
     with session_scope() as s:
-        stmt = select(Note)
-        if not include_archived:
-            stmt = stmt.where(Note.archived == False)  # type: ignore[comparison-overlap]  # noqa: E712
-        if tag:
-            tag = tag.strip().lower()
-            stmt = stmt.where(Note.tags_csv.like(f"%{tag}%"))
-        if search:
-            like = f"%{search}%"
-            stmt = stmt.where((Note.title.like(like)) | (Note.content.like(like)))
-
-        if sort == "created":
-            stmt = stmt.order_by(Note.created_at.desc())
-        elif sort == "title":
-            stmt = stmt.order_by(Note.title.asc())
+        if summary:
+            return [NoteSummary(*row) for row in s.exec(stmt, params=params)]
+        return list(s.exec(stmt, params=params))
+
+
+@lru_cache(maxsize=32)
+def _list_stmt(
+    has_tag: bool,
+    search_mode: str,
+    include_archived: bool,
+    sort: str,
+    has_prefix: bool = False,
+    summary: bool = False,
+):
+    """Statement per filter *shape* (values arrive as bound parameters), so a
+    hot endpoint reuses the constructed/compiled Select instead of rebuilding
+    it every call."""
+    stmt = select(*_SUMMARY_COLS) if summary else select(Note)
+    if not include_archived:
+        # false() renders as the literal 0 (not a bound parameter), which the
+        # planner needs to prove it can use the partial WHERE archived = 0 indexes
+        stmt = stmt.where(Note.archived == false())
+    if has_tag:
+        stmt = stmt.join(NoteTag, NoteTag.note_id == Note.id).where(NoteTag.tag == bindparam("tag"))
+    if search_mode == "fts":
+        stmt = stmt.where(Note.id.in_(_FTS_ROWIDS))
+    elif search_mode == "like":
+        like = bindparam("like")
+        stmt = stmt.where((Note.title.like(like)) | (Note.content.like(like)))
+    if has_prefix:
+        # served as an index range scan thanks to title's NOCASE collation
+        stmt = stmt.where(Note.title.like(bindparam("title_prefix")))
+
+    return stmt.order_by(_SORT_ORDERS.get(sort, _SORT_ORDERS["updated"]))
+
+
+def _build_list_stmt(
+    tag: Optional[str],
+    search: Optional[str],
+    include_archived: bool,
+    sort: str,
+    title_prefix: Optional[str] = None,
+    summary: bool = False,
+):
+    """Map concrete filter values to a cached statement plus its parameters."""
+    params: dict = {}
+    if tag:
+        params["tag"] = tag.strip().lower()
+    search_mode = ""
+    if search:
+        if len(search) >= 3:
+            search_mode = "fts"
+            params["fts_q"] = _fts_query(search)
         else:
-            stmt = stmt.order_by(Note.updated_at.desc())
+            # trigram FTS needs at least 3 chars; fall back to a scan
+            search_mode = "like"
+            params["like"] = f"%{search}%"
+    if title_prefix:
+        params["title_prefix"] = f"{title_prefix}%"
+    stmt = _list_stmt(
+        bool(tag), search_mode, include_archived, sort, bool(title_prefix), summary
+    )
+    return stmt, params
+
+
+def list_notes_iter(
+    tag: Optional[str] = None,
+    search: Optional[str] = None,
+    include_archived: bool = False,
+    sort: str = "updated",
+    batch_size: int = 200,
+    summary: bool = False,
+):
+    """Same filters as list_notes, but yields notes in streamed batches
+    instead of materializing the whole result. The session stays open until
+    the generator is exhausted."""
+    stmt, params = _build_list_stmt(tag, search, include_archived, sort, summary=summary)
+    stmt = stmt.execution_options(yield_per=batch_size)
+    with session_scope() as s:
+        if summary:
+            for row in s.exec(stmt, params=params):
+                yield NoteSummary(*row)
+        else:
+            yield from s.exec(stmt, params=params)
+
+# keyed (title, data_version()): an in-process write starts a fresh cache
+# generation instantly, and the TTL bounds staleness from writes this process
+# never sees (CLI beside the server, other uvicorn workers)
+_TITLE_IDS: TTLCache = TTLCache(maxsize=4096, ttl=5)
+
+def _title_to_id(title: str, version: int) -> Optional[int]:
+    # threadpool handlers hit this concurrently and TTLCache mutates shared
+    # bookkeeping even on reads (expiry), so every access takes the lock;
+    # the DB query itself runs outside it
+    key = (title, version)
+    with _STATE_LOCK:
+        try:
+            return _TITLE_IDS[key]
+        except KeyError:
+            pass
+    with session_scope() as s:
+        nid = s.exec(select(Note.id).where(_title_eq(title))).first()
+    with _STATE_LOCK:
+        _TITLE_IDS[key] = nid
+    return nid
 
-        return list(s.exec(stmt))
-    
 
 def get_note(identifier: int | str) -> Optional[Note]:
     """Fetch by id (int/str digits) or exact title."""
     with session_scope() as s:
-        if isinstance(identifier, int) or str(identifier).isdigit():
-            obj = s.get(Note, int(identifier))
+        if type(identifier) is int:
+            # hot path for programmatic callers: no str() allocation, no
+            # isdigit scan, and ints never double as titles
+            return s.get(Note, identifier)
+        sid = identifier if isinstance(identifier, str) else str(identifier)
+        if sid.isdigit():
+            obj = s.get(Note, int(sid))
             if obj:
                 return obj
-        stmt = select(Note).where(Note.title == str(identifier))
-        return s.exec(stmt).first()
+        nid = _title_to_id(sid, data_version())
+        return s.get(Note, nid) if nid is not None else None
+
+
+def _resolve_note_id(s, identifier: int | str) -> Optional[int]:
+    """Resolve id-or-title to a note id inside the caller's session."""
+    if type(identifier) is int:
+        return s.exec(select(Note.id).where(Note.id == identifier)).first()
+    sid = identifier if isinstance(identifier, str) else str(identifier)
+    if sid.isdigit():
+        nid = int(sid)
+        if s.exec(select(Note.id).where(Note.id == nid)).first() is not None:
+            return nid
+    return s.exec(select(Note.id).where(_title_eq(sid))).first()
+
+
+def _update_note(s, nid: int, values: dict) -> Note:
+    """Apply one UPDATE and return the fresh row (session-local helper).
+
+    UPDATE ... RETURNING brings back the updated row — including the
+    SQL-side onupdate timestamp — in the same statement, so no follow-up
+    SELECT runs. populate_existing pushes the returned values into any
+    already-loaded instance of the note.
+    """
+    note = s.scalars(
+        update(Note).where(Note.id == nid).values(**values).returning(Note),
+        execution_options={"synchronize_session": False, "populate_existing": True},
+    ).one()
+    mark_data_changed()
+    return note
 
 
 def edit_note(
@@ -84,90 +316,108 @@ def edit_note(
     """
     Update fields and bump updated_at. Returns the updated note.
     """
-    tags_list = None if tags is None else _normal_tags(tags)
+    tags_list = None if tags is None else normalize_tags(tags)
     with session_scope() as s:
-        note = get_note(identifier)
-        if not note:
+        nid = _resolve_note_id(s, identifier)
+        if nid is None:
             raise ValueError(f"Note '{identifier}' not found")
-        note = s.merge(note)  # attach to this session
 
+        values: dict = {}
         if title is not None:
-            note.title = title
+            values["title"] = title
         if content is not None:
-            note.content = content
+            values["content"] = content
         if tags_list is not None:
-            note.set_tags(tags_list)
+            values["tags_csv"] = ",".join(tags_list)
+            _sync_note_tags(s, nid, tags_list)
         if archived is not None:
-            note.archived = archived
+            values["archived"] = archived
         if pinned is not None:
-            note.pinned = pinned
+            values["pinned"] = pinned
+        return _update_note(s, nid, values)
 
-        note.updated_at = datetime.now(UTC)
-        s.add(note)
-        s.flush()
-        s.refresh(note)
-        return note
-    
 
 def delete_note(identifier: int | str, hard: bool = False) -> None:
     """Soft delete by default (archive). Hard delete removes the row."""
     with session_scope() as s:
-        note = get_note(identifier)
-        if not note:
+        nid = _resolve_note_id(s, identifier)
+        if nid is None:
             return
-        note = s.merge(note)
         if hard:
-            s.delete(note)
+            s.execute(sa_delete(NoteTag).where(NoteTag.note_id == nid))
+            s.execute(sa_delete(Note).where(Note.id == nid))
+            mark_data_changed()
         else:
-            note.archived = True
-            note.updated_at = datetime.now(UTC)
-            s.add(note)
+            _update_note(s, nid, {"archived": True})
 
 def pin_note(identifier: int | str, value: bool = True) -> Note:
     with session_scope() as s:
-        note = get_note(identifier)
-        if not note:
+        nid = _resolve_note_id(s, identifier)
+        if nid is None:
             raise ValueError(f"Note '{identifier}' not found")
-        note = s.merge(note)
-        note.pinned = value
-        note.updated_at = datetime.now(UTC)
-        s.add(note)
-        s.flush()          # <-- make sure changes hit the DB
-        s.refresh(note)    # <-- now safe to reload
-        return note
+        return _update_note(s, nid, {"pinned": value})
 
 def archive_note(identifier: int | str, value: bool = True) -> Note:
     with session_scope() as s:
-        note = get_note(identifier)
-        if not note:
+        nid = _resolve_note_id(s, identifier)
+        if nid is None:
             raise ValueError(f"Note '{identifier}' not found")
-        note = s.merge(note)
-        note.archived = value
-        note.updated_at = datetime.now(UTC)
-        s.add(note)
-        s.flush()          # <-- flush before refresh
-        s.refresh(note)
-        return note
+        return _update_note(s, nid, {"archived": value})
 
 def restore_note(identifier: int | str) -> Note:
-    return archive_note(identifier, value=False)
+    with session_scope() as s:
+        nid = _resolve_note_id(s, identifier)
+        if nid is None:
+            raise ValueError(f"Note '{identifier}' not found")
+        return _update_note(s, nid, {"archived": False})
 
 def purge_note(identifier: int | str) -> None:
-    delete_note(identifier, hard=True)
+    with session_scope() as s:
+        nid = _resolve_note_id(s, identifier)
+        if nid is None:
+            return
+        s.execute(sa_delete(NoteTag).where(NoteTag.note_id == nid))
+        s.execute(sa_delete(Note).where(Note.id == nid))
+        mark_data_changed()
 
 def extract_links(content: str | None) -> list[str]:
     if not content:
         return []
-    return sorted({m.group(1).strip() for m in BACKLINK_RE.finditer(content)})
+    # findall returns the captured group directly — no Match object per hit
+    return sorted({m.strip() for m in BACKLINK_RE.findall(content)})
 
-def backlinks_for(identifier: int | str, include_archived: bool = False) -> list[Note]:
-    """Return notes that link to the given note via [[Title]]."""
-    target = get_note(identifier)
-    if not target:
-        return []
-    title = target.title
+def backlinks_for(
+    identifier: int | str,
+    include_archived: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> list[Note]:
+    """Return notes that link to the given note via [[Title]].
+
+    Resolves the target and fetches all linking notes inside one session,
+    so the whole lookup is a single transaction (no per-note round trips).
+    """
     with session_scope() as s:
-        stmt = select(Note).where(Note.content.like(f"%[[{title}]]%"))
+        target = None
+        if isinstance(identifier, int) or str(identifier).isdigit():
+            target = s.get(Note, int(identifier))
+        if target is None:
+            target = s.exec(select(Note).where(_title_eq(str(identifier)))).first()
+        if not target:
+            return []
+        needle = f"[[{target.title}]]"
+        # the FTS MATCH narrows to candidate rows via the trigram index; INSTR
+        # confirms the marker appears in content (MATCH also covers title).
+        # Unlike LIKE, INSTR treats the needle literally, so titles containing
+        # % or _ can't act as wildcards.
+        stmt = (
+            select(Note)
+            .where(Note.id.in_(_FTS_ROWIDS))
+            .params(fts_q=_fts_query(needle))
+            .where(func.instr(Note.content, needle) > 0)
+        )
         if not include_archived:
-            stmt = stmt.where(Note.archived == False)  # noqa: E712
+            stmt = stmt.where(Note.archived == false())
+        if limit is not None or offset:
+            stmt = stmt.limit(limit).offset(offset)
         return list(s.exec(stmt))
\ No newline at end of file
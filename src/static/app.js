@@ -0,0 +1,244 @@
+// ---------- tiny utils ----------
+const $ = (sel, root=document) => root.querySelector(sel);
+const $$ = (sel, root=document) => Array.from(root.querySelectorAll(sel));
+const sleep = (ms) => new Promise(r=>setTimeout(r, ms));
+const store = {
+  get k(){ return 'notely-ui'; },
+  get(){ try{return JSON.parse(localStorage.getItem(this.k)||'{}')}catch{return{}} },
+  set(v){ localStorage.setItem(this.k, JSON.stringify(v)) }
+};
+function toast(msg, kind='ok'){
+  const el = document.createElement('div');
+  el.className = 'px-3 py-2 rounded-lg shadow bg-white dark:bg-slate-900 border ' +
+                 (kind==='err'?'border-rose-400 text-rose-700 dark:text-rose-300':'border-slate-200 dark:border-slate-700');
+  el.textContent = msg;
+  $('#toast').appendChild(el);
+  setTimeout(()=>{ el.classList.add('opacity-0','translate-y-1'); }, 2500);
+  setTimeout(()=> el.remove(), 3000);
+}
+async function j(url, opts={}){
+  const res = await fetch(url, {headers:{'content-type':'application/json'}, ...opts});
+  if(!res.ok){
+    let text = await res.text().catch(()=>res.statusText);
+    try{ const d=JSON.parse(text); text=d.detail||text }catch{}
+    throw new Error(text || res.statusText);
+  }
+  if(res.status===204) return null;
+  return res.json();
+}
+function debounce(fn, ms=250){
+  let t; return (...args)=>{ clearTimeout(t); t = setTimeout(()=>fn(...args), ms); }
+}
+
+// ---------- theme ----------
+function applyTheme(){
+  const st = store.get();
+  const dark = st.theme==='dark' || (!('theme' in st) && window.matchMedia('(prefers-color-scheme: dark)').matches);
+  document.documentElement.classList.toggle('dark', dark);
+  $('#sun').classList.toggle('hidden', dark);
+  $('#moon').classList.toggle('hidden', !dark);
+}
+applyTheme();
+$('#themeBtn').addEventListener('click', ()=>{
+  const st = store.get(); st.theme = (document.documentElement.classList.contains('dark') ? 'light' : 'dark'); store.set(st); applyTheme();
+});
+
+// ---------- app state ----------
+let notes = [];
+let current = null;
+let selectedTag = null;
+
+const qInput = $('#q');
+const sortSel = $('#sort');
+const chkArchived = $('#showArchived');
+const chkPinned = $('#onlyPinned');
+
+// ---------- fetch & render ----------
+async function load(){
+  const params = new URLSearchParams();
+  params.set('sort', sortSel.value);
+  if(qInput.value.trim()) params.set('search', qInput.value.trim());
+  if(selectedTag) params.set('tag', selectedTag);
+  if(chkArchived.checked) params.set('archived','true');
+  const data = await j('/api/notes?'+params.toString());
+  notes = data;
+  renderTags();
+  renderList();
+  if(current){
+    const refreshed = notes.find(n => n.id===current.id);
+    if(refreshed) current = refreshed;
+    renderDetail();
+  } else if(notes[0]) { select(notes[0].id); }
+}
+
+function renderTags(){
+  const set = new Set();
+  notes.forEach(n => (n.tags||[]).forEach(t => set.add(t)));
+  const tags = Array.from(set).sort((a,b)=>a.localeCompare(b));
+  const box = $('#tags');
+  box.innerHTML = tags.map(t => `
+    <button data-tag="${t}" class="pill border-slate-300 dark:border-slate-700 ${selectedTag===t?'bg-blue-600 text-white border-blue-600':''}">
+      #${t}
+    </button>`).join('') || '<div class="text-sm text-slate-500">no tags</div>';
+  $$('#tags [data-tag]').forEach(btn => btn.addEventListener('click', ()=>{
+    selectedTag = (selectedTag===btn.dataset.tag) ? null : btn.dataset.tag;
+    $('#clearTag').classList.toggle('hidden', !selectedTag);
+    load();
+  }));
+  $('#clearTag').classList.toggle('hidden', !selectedTag);
+  $('#clearTag').onclick = ()=>{ selectedTag=null; load(); };
+}
+
+function renderList(){
+  const list = $('#list');
+  const filt = notes.filter(n => chkPinned.checked ? n.pinned : true);
+  list.innerHTML = filt.map(n => `
+    <button class="text-left rounded-xl border border-slate-200 dark:border-slate-800 p-3 hover:bg-slate-100 dark:hover:bg-slate-900 transition ${current && current.id===n.id ? 'ring-2 ring-blue-500' : ''}"
+            onclick="select(${n.id})">
+      <div class="flex items-center gap-2">
+        <div class="font-semibold truncate">#${n.id} ${n.title}</div>
+        ${n.pinned ? '<span class="pill border-yellow-400 text-yellow-700 dark:text-yellow-300">pinned</span>' : ''}
+        ${n.archived ? '<span class="pill border-slate-400 text-slate-500">archived</span>' : ''}
+      </div>
+      <div class="mt-1 text-sm text-slate-500">
+        ${(n.tags||[]).map(t=>`<span class="pill border-slate-300 dark:border-slate-700">#${t}</span>`).join(' ')}
+      </div>
+      <div class="mt-1 text-xs text-slate-400">updated ${new Date(n.updated_at).toLocaleString()}</div>
+    </button>
+  `).join('') || '<div class="text-sm text-slate-500">no notes</div>';
+}
+
+function renderDetail(){
+  const d = $('#detail'); if(!current){ d.innerHTML=''; return; }
+  d.innerHTML = `
+    <div class="rounded-xl border border-slate-200 dark:border-slate-800">
+      <div class="p-3 border-b border-slate-200 dark:border-slate-800 flex items-center gap-2">
+        <input id="title" class="flex-1 bg-transparent outline-none font-semibold" value="${escapeHtml(current.title)}" />
+        <button class="btn btn-ghost" onclick="togglePin()">${current.pinned?'Unpin':'Pin'}</button>
+        <button class="btn btn-ghost" onclick="toggleArchive()">${current.archived?'Unarchive':'Archive'}</button>
+        <button class="btn btn-warn" onclick="delNote()">Delete</button>
+      </div>
+      <div class="p-3">
+        <div class="flex items-center gap-3 text-sm mb-2">
+          <button id="dTabEdit" class="btn btn-ghost">Edit</button>
+          <button id="dTabPreview" class="btn btn-ghost">Preview</button>
+        </div>
+        <textarea id="content" class="w-full h-64 rounded-lg border px-3 py-2 bg-white dark:bg-slate-900 border-slate-300 dark:border-slate-700">${escapeHtml(current.content||"")}</textarea>
+        <div id="preview" class="prose prose-slate dark:prose-invert max-w-none hidden"></div>
+        <div class="mt-2 text-sm text-slate-500">
+          ${(current.tags||[]).map(t=>`<span class="pill border-slate-300 dark:border-slate-700">#${t}</span>`).join(' ')}
+        </div>
+        <div class="mt-3">
+          <strong>Backlinks</strong>
+          <div id="backlinks" class="mt-1 text-sm"></div>
+        </div>
+      </div>
+    </div>
+  `;
+  $('#dTabEdit').onclick = ()=>{ $('#content').classList.remove('hidden'); $('#preview').classList.add('hidden'); };
+  $('#dTabPreview').onclick = ()=>{ renderPreview('#content','#preview'); };
+  loadBacklinks();
+  $('#title').addEventListener('change', saveTitle);
+  $('#content').addEventListener('change', saveContent);
+}
+
+function renderPreview(srcSel, destSel){
+  const md = $(srcSel).value;
+  const html = DOMPurify.sanitize(marked.parse(md||""));
+  $(destSel).innerHTML = html;
+  $(srcSel).classList.add('hidden');
+  $(destSel).classList.remove('hidden');
+}
+
+async function loadBacklinks(){
+  const bl = await j(`/api/notes/${current.id}/backlinks`);
+  $('#backlinks').innerHTML = bl.length
+    ? bl.map(b=>`<a class="text-blue-600 hover:underline" href="javascript:select(${b.id})">#${b.id} ${escapeHtml(b.title)}</a>`).join('<br/>')
+    : '<span class="text-slate-500">none</span>';
+}
+
+// ---------- actions ----------
+async function select(id){
+  current = await j(`/api/notes/${id}`);
+  renderList(); renderDetail();
+  // Keep scroll in view for current item
+  await sleep(50);
+  const btn = $(`#list button[onclick="select(${id})"]`); if(btn) btn.scrollIntoView({block:'nearest'});
+}
+async function saveTitle(){
+  const title = $('#title').value.trim();
+  if(!title){ toast('Title required','err'); return; }
+  current = await j(`/api/notes/${current.id}`, {method:'PATCH', body: JSON.stringify({title})});
+  toast('Saved title'); load();
+}
+async function saveContent(){
+  const content = $('#content').value;
+  current = await j(`/api/notes/${current.id}`, {method:'PATCH', body: JSON.stringify({content})});
+  toast('Saved content'); load();
+}
+async function togglePin(){
+  current = await j(`/api/notes/${current.id}/pin?value=${!current.pinned}`, {method:'POST'});
+  toast(current.pinned?'Pinned':'Unpinned'); load();
+}
+async function toggleArchive(){
+  current = await j(`/api/notes/${current.id}/archive?value=${!current.archived}`, {method:'POST'});
+  toast(current.archived?'Archived':'Unarchived'); load();
+}
+async function delNote(){
+  if(!confirm('Delete this note?')) return;
+  await j(`/api/notes/${current.id}`, {method:'DELETE'});
+  current = null; toast('Deleted'); load();
+}
+
+// ---------- modal new note ----------
+const modal = $('#modal'); const newBtn = $('#newBtn'); const mtitle=$('#mtitle'); const mcontent=$('#mcontent'); const mtags=$('#mtags');
+const tabEdit=$('#tabEdit'); const tabPrev=$('#tabPreview'); const mprev=$('#mpreview'); const saveBtn=$('#saveBtn');
+newBtn.addEventListener('click', ()=>{ $('#modalTitle').textContent='New note'; mtitle.value=''; mcontent.value=''; mtags.value=''; mprev.classList.add('hidden'); $('#mcontent').classList.remove('hidden'); modal.showModal(); mtitle.focus(); });
+$('#modalClose').addEventListener('click', ()=> modal.close());
+tabEdit.onclick = ()=>{ mprev.classList.add('hidden'); mcontent.classList.remove('hidden'); };
+tabPrev.onclick = ()=>{ mprev.innerHTML = DOMPurify.sanitize(marked.parse(mcontent.value||"")); mcontent.classList.add('hidden'); mprev.classList.remove('hidden'); };
+saveBtn.addEventListener('click', async (e)=>{ e.preventDefault();
+  const title = mtitle.value.trim(); if(!title){ toast('Title required','err'); return; }
+  const tags = mtags.value.split(',').map(s=>s.trim()).filter(Boolean);
+  await j('/api/notes', {method:'POST', body:JSON.stringify({title, content:mcontent.value, tags})});
+  toast('Created'); modal.close(); load();
+});
+
+// ---------- events & shortcuts ----------
+qInput.addEventListener('input', debounce(load, 250));
+sortSel.addEventListener('change', load);
+chkArchived.addEventListener('change', load);
+chkPinned.addEventListener('change', load);
+
+document.addEventListener('keydown', (e)=>{
+    const tag = e.target.tagName;
+    const isTyping = tag === 'INPUT' || tag === 'TEXTAREA' || e.target.isContentEditable;
+    const k = e.key;
+
+    // Focus search with "/"
+    if (k === '/' && !isTyping) {
+    e.preventDefault();
+    qInput.focus();
+    return;
+    }
+
+    // Save with Ctrl/Cmd+S (allowed while typing)
+    if ((k === 's' || k === 'S') && (e.ctrlKey || e.metaKey)) {
+    e.preventDefault();
+    if (current) { saveContent(); }
+    return;
+    }
+
+    // Ignore the rest while typing (so letters like 'n','p','a' don't trigger)
+    if (isTyping) return;
+
+    // New / Pin / Archive
+    if (k === 'n' || k === 'N') { e.preventDefault(); $('#newBtn').click(); return; }
+    if (k === 'p' || k === 'P') { if (current) { e.preventDefault(); togglePin(); } return; }
+    if (k === 'a' || k === 'A') { if (current) { e.preventDefault(); toggleArchive(); } return; }
+});
+
+function escapeHtml(s){ return (s||'').replace(/[&<>"]/g, c=>({'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;'}[c])); }
+
+// initial load
+load();
@@ -1,5 +1,5 @@
 from src.db import init_db, reset_engine
-from src.services import create_note
+from src.services import create_note, create_notes, list_notes
 
 def test_create_note_service_and_return_id(tmp_path, monkeypatch):
     test_db = tmp_path / "test.db"
@@ -12,3 +12,16 @@ def test_create_note_service_and_return_id(tmp_path, monkeypatch):
     assert note.title == "hello"
     assert note.content == "world"
     assert note.tags == ["ideas", "work"]
+
+def test_create_notes_bulk(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOTELY_DB_PATH", str(tmp_path / "bulk.db"))
+    reset_engine()
+    init_db()
+
+    ids = create_notes([
+        {"title": "one", "content": "a", "tags": ["x"]},
+        {"title": "two"},
+        {"title": "three", "tags": ["X", "y"]},
+    ])
+    assert len(ids) == 3
+    assert {n.title for n in list_notes()} == {"one", "two", "three"}
@@ -1,5 +1,5 @@
 from src.db import init_db, reset_engine
-from src.services import create_note, list_notes, edit_note
+from src.services import backlinks_for, create_note, list_notes, edit_note
 
 def test_list_filters_and_sorting(tmp_path, monkeypatch):
     monkeypatch.setenv("NOTELY_DB_PATH", str(tmp_path / "db1.sqlite"))
@@ -27,6 +27,42 @@ def test_list_filters_and_sorting(tmp_path, monkeypatch):
     by_title = list_notes(sort="title")
     assert [n.title for n in by_title] == ["alpha", "beta", "gamma"]
 
+def test_list_summary_title_prefix_and_pagination(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOTELY_DB_PATH", str(tmp_path / "db3.sqlite"))
+    reset_engine()
+    init_db()
+
+    create_note("alpha", "first body", tags=["work"])
+    create_note("Alphabet", "second body")
+    create_note("beta", "third body")
+
+    # summary rows skip content but keep the tags accessor
+    rows = list_notes(sort="title", summary=True)
+    assert [r.title for r in rows] == ["alpha", "Alphabet", "beta"]
+    assert rows[0].tags == ["work"] and rows[1].tags == []
+    assert not hasattr(rows[0], "content")
+
+    # title prefix matches case-insensitively
+    assert {n.title for n in list_notes(title_prefix="ALPH")} == {"alpha", "Alphabet"}
+
+    # limit/offset page through the sorted result
+    assert [n.title for n in list_notes(sort="title", limit=2)] == ["alpha", "Alphabet"]
+    assert [n.title for n in list_notes(sort="title", limit=2, offset=2)] == ["beta"]
+    assert [n.title for n in list_notes(sort="title", offset=1)] == ["Alphabet", "beta"]
+
+def test_backlinks_pagination(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOTELY_DB_PATH", str(tmp_path / "db4.sqlite"))
+    reset_engine()
+    init_db()
+
+    create_note("hub", "the target")
+    for i in range(4):
+        create_note(f"link{i}", "see [[hub]]")
+
+    assert len(backlinks_for("hub")) == 4
+    assert len(backlinks_for("hub", limit=2)) == 2
+    assert len(backlinks_for("hub", limit=3, offset=3)) == 1
+
 def test_edit_updates_fields_and_timestamp(tmp_path, monkeypatch):
     monkeypatch.setenv("NOTELY_DB_PATH", str(tmp_path / "db2.sqlite"))
     reset_engine()